@@ -0,0 +1,45 @@
+"""Use server-side timestamp defaults
+
+Revision ID: 4a5ebaf05df3
+Revises: 97b245c63608
+Create Date: 2026-10-15 14:10:37.205184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a5ebaf05df3'
+down_revision: Union[str, None] = '97b245c63608'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Timestamp columns that now default to the database's current time
+TIMESTAMP_COLUMNS = {
+    'admins': ['created_at'],
+    'users': ['created_at', 'updated_at'],
+    'notifications': ['created_at'],
+    'posts': ['created_at', 'updated_at'],
+    'comments': ['created_at', 'updated_at'],
+}
+
+
+def upgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column, existing_type=sa.DateTime(), server_default=sa.func.now()
+                )
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                batch_op.alter_column(
+                    column, existing_type=sa.DateTime(), server_default=None
+                )
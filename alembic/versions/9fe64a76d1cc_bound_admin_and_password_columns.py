@@ -0,0 +1,38 @@
+"""Bound admin and password column widths
+
+Revision ID: 9fe64a76d1cc
+Revises: 4a5ebaf05df3
+Create Date: 2026-10-15 14:31:52.640271
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9fe64a76d1cc'
+down_revision: Union[str, None] = '4a5ebaf05df3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('admins') as batch_op:
+        batch_op.alter_column('username', existing_type=sa.String(), type_=sa.String(length=50), existing_nullable=False)
+        batch_op.alter_column('email', existing_type=sa.String(), type_=sa.String(length=100), existing_nullable=False)
+        batch_op.alter_column('hashed_password', existing_type=sa.String(), type_=sa.String(length=255), existing_nullable=False)
+
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('hashed_password', existing_type=sa.String(), type_=sa.String(length=255), existing_nullable=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column('hashed_password', existing_type=sa.String(length=255), type_=sa.String(), existing_nullable=False)
+
+    with op.batch_alter_table('admins') as batch_op:
+        batch_op.alter_column('hashed_password', existing_type=sa.String(length=255), type_=sa.String(), existing_nullable=False)
+        batch_op.alter_column('email', existing_type=sa.String(length=100), type_=sa.String(), existing_nullable=False)
+        batch_op.alter_column('username', existing_type=sa.String(length=50), type_=sa.String(), existing_nullable=False)
@@ -1,2 +1,2 @@
 from .jobs import *
-from .scheduler import start_scheduler, scheduler
\ No newline at end of file
+from .scheduler import start_scheduler, stop_scheduler, scheduler
\ No newline at end of file
@@ -1,31 +1,51 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete, select
 from app.database import SessionLocal
 from app.models import Notification
-from app.utils import logger
+from app.utils import logger, settings
 
 def delete_old_notifications():
     """
     Deletes notifications that are older than 30 days.
+
+    Notifications are removed in batches of `NOTIFICATION_CLEANUP_BATCH_SIZE`
+    rows, committing after each batch so locks are held only briefly.
     """
-    db = SessionLocal()
     try:
-        # Calculate the threshold date
-        threshold_date = datetime.now() - timedelta(days=30)
+        # Calculate the threshold date in naive UTC, matching the
+        # database-generated `created_at` timestamps
+        threshold_date = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=30)
 
-        # Query and delete notifications older than the threshold
-        deleted_count = (
-            db.query(Notification)
-            .filter(Notification.created_at < threshold_date)
-            .delete()
+        # Build the batched delete once; each execution removes up to one batch
+        batch = (
+            select(Notification.id)
+            .where(Notification.created_at < threshold_date)
+            .order_by(Notification.created_at)
+            .limit(settings.NOTIFICATION_CLEANUP_BATCH_SIZE)
+        )
+        stmt = (
+            delete(Notification)
+            .where(Notification.id.in_(batch))
+            .execution_options(synchronize_session=False)
         )
-        db.commit()
+
+        # Delete old notifications batch by batch until none are left. The
+        # session is always closed, and each batch's transaction is committed
+        # on success or rolled back on error by its context manager.
+        deleted_count = 0
+        with SessionLocal() as db:
+            while True:
+                with db.begin():
+                    batch_count = db.execute(stmt).rowcount
+
+                if batch_count == 0:
+                    break
+                deleted_count += batch_count
 
         # Log the cleanup process
         if deleted_count > 0:
-            logger.info(f"Deleted {deleted_count} notifications older than 30 days.")
+            logger.info("Deleted %s notifications older than 30 days.", deleted_count)
         else:
             logger.info("No notifications older than 30 days to delete.")
     except Exception as e:
-        logger.error(f"Error occurred while deleting old notifications: {e}")
-    finally:
-        db.close()
\ No newline at end of file
+        logger.error("Error occurred while deleting old notifications: %s", e)
\ No newline at end of file
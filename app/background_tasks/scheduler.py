@@ -1,11 +1,80 @@
-from apscheduler.schedulers.background import BackgroundScheduler
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from app.background_tasks import delete_old_notifications
+from app.utils import logger, settings
 
-scheduler = BackgroundScheduler()
+# Runs on the application's event loop; must be started from within it
+scheduler = AsyncIOScheduler()
+
+# Lock file held open by the worker that runs the scheduler
+_lock_file = None
+
+def _acquire_scheduler_lock():
+    """
+    Takes a non-blocking exclusive lock on `SCHEDULER_LOCK_FILE` so only one
+    worker process runs the scheduler. The lock is released when the file is
+    closed or the process exits. If the lock file can't be opened, the
+    scheduler runs unlocked, as it does where `fcntl` is unavailable.
+    """
+    global _lock_file
+    if fcntl is None:
+        return True
+
+    try:
+        lock_file = open(settings.SCHEDULER_LOCK_FILE, "a")
+    except OSError as e:
+        logger.error(
+            "Could not open scheduler lock file '%s': %s. Running the scheduler without it.",
+            settings.SCHEDULER_LOCK_FILE,
+            e,
+        )
+        return True
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock_file.close()
+        return False
+    _lock_file = lock_file
+    return True
 
 def start_scheduler():
+    """
+    Starts the scheduler unless another worker process already runs it.
+    Returns whether the scheduler was started.
+    """
+    if not _acquire_scheduler_lock():
+        logger.info("Scheduler is running in another worker; skipping startup.")
+        return False
+
     # Add jobs to the scheduler
-    scheduler.add_job(delete_old_notifications, IntervalTrigger(days=1))
+    # Synchronous jobs are dispatched to the event loop's default executor,
+    # so blocking database work never runs on the loop itself. At most one
+    # cleanup runs at a time, and missed runs within an hour are collapsed
+    # into a single catch-up run.
+    scheduler.add_job(
+        delete_old_notifications,
+        IntervalTrigger(days=1),
+        id="notification_cleanup",
+        coalesce=True,
+        max_instances=1,
+        misfire_grace_time=3600,
+        replace_existing=True,
+    )
     # Start the scheduler
-    scheduler.start()
\ No newline at end of file
+    scheduler.start()
+    return True
+
+def stop_scheduler():
+    """
+    Shuts down the scheduler, if running, and releases the scheduler lock.
+    """
+    global _lock_file
+    if scheduler.running:
+        scheduler.shutdown(wait=False)
+    if _lock_file is not None:
+        _lock_file.close()
+        _lock_file = None
\ No newline at end of file
@@ -7,7 +7,17 @@ from app.utils import settings
 DATABASE_URL = settings.BLOG_DATABASE_URL
 
 # Create the database engine
-engine = create_engine(DATABASE_URL)
+# The pool hands out the most recently used connection first (LIFO) so idle
+# overflow connections can time out, and pings connections before reuse
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    pool_use_lifo=True,
+)
 
 # Create a session local for handling database sessions
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
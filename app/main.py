@@ -5,25 +5,26 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from app.database import engine, Base
 from app.utils import settings  # Configuration settings (e.g., environment variables)
-from app.background_tasks import start_scheduler, scheduler
+from app.background_tasks import start_scheduler, stop_scheduler
 from app.routers import (
     auth_router,
     admin_router
 )
 
-# Initialize database (create tables if they don't exist)
-Base.metadata.create_all(bind=engine)
-
 # Create the FastAPI application
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan events."""
     print("Starting up the application...")
+    if settings.DEBUG:
+        # Create missing tables in development; other environments manage the
+        # schema with Alembic migrations
+        Base.metadata.create_all(bind=engine)
     start_scheduler()
     try:
         yield
     finally:
-        scheduler.shutdown()
+        stop_scheduler()
         print("Shutting down the application...")
 
 app = FastAPI(
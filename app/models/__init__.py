@@ -1,3 +1,8 @@
 from .user import User
 from .notification import Notification
-from .admin import Admin
\ No newline at end of file
+from .admin import Admin
+from .category import Category
+from .post import Post
+from .comment import Comment
+from .tag import Tag
+from .post_tags import PostTags
\ No newline at end of file
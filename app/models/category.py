@@ -12,5 +12,5 @@ class Category(Base):
     description = Column(String(255))
 
     posts = relationship(
-        "Post", back_populates="category"
+        "Post", back_populates="category", lazy="raise_on_sql"
     )
\ No newline at end of file
@@ -1,8 +1,7 @@
 # app/models/notification.py
 
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from app.database import Base
 
 class Notification(Base):
@@ -20,11 +19,16 @@ class Notification(Base):
         owner (User): Reference to the User who received the notification, with a back-populated 'notifications' attribute.
     """
     __tablename__ = "notifications"
-    
+    __table_args__ = (
+        # Covers the cleanup job's `created_at < threshold ORDER BY created_at`
+        # id lookup, so each batch is an index-only range scan
+        Index("ix_notifications_created_at_purge", "created_at", "id"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     message = Column(String(255), nullable=False)
     is_read = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.now(), index=True)
+    created_at = Column(DateTime, server_default=func.now())
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     
     # Relationships
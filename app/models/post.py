@@ -1,9 +1,8 @@
 # app/models/post.py
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, func
 from sqlalchemy.orm import relationship
 from app.database import Base
-from datetime import datetime
 
 class Post(Base):
     __tablename__ = 'posts'
@@ -11,8 +10,8 @@ class Post(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(150), nullable=False)
     content = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.now())
-    updated_at = Column(DateTime, default=datetime.now(), onupdate=datetime.now())
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     is_published = Column(Boolean, default=False)
     author_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
@@ -24,8 +23,8 @@ class Post(Base):
         "Category", back_populates="posts"
     )
     comments = relationship(
-        "Comment", back_populates="posts", cascade="all, delete"
+        "Comment", back_populates="post", cascade="all, delete", lazy="raise_on_sql"
     )
     tags = relationship(
-        "Tag", secondary="post_tags", back_populates="posts"
+        "Tag", secondary="post_tags", back_populates="posts", lazy="raise_on_sql"
     )
\ No newline at end of file
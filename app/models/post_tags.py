@@ -1,10 +1,14 @@
 # app/models/post_tags.py
 
-from sqlalchemy import Column, Integer, ForeignKey
+from sqlalchemy import Column, Integer, ForeignKey, Index
 from app.database import Base
 
 class PostTags(Base):
     __tablename__ = "post_tags"
+    __table_args__ = (
+        # The primary key serves post -> tags lookups; this serves tag -> posts
+        Index("ix_post_tags_tag_post", "tag_id", "post_id"),
+    )
 
     post_id = Column(Integer, ForeignKey("posts.id"), primary_key=True)
     tag_id = Column(Integer, ForeignKey("tags.id"), primary_key=True)
\ No newline at end of file
@@ -11,5 +11,5 @@ class Tag(Base):
     name =  Column(String(50), unique=True, nullable=False)
 
     posts = relationship(
-        "Post", secondary="post_tags", back_populates="tags"
+        "Post", secondary="post_tags", back_populates="tags", lazy="raise_on_sql"
     )
\ No newline at end of file
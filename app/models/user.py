@@ -1,9 +1,8 @@
 # app/models/user.py
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, func
 from sqlalchemy.orm import relationship
 from app.database import Base
-from datetime import datetime
 
 
 class User(Base):
@@ -16,7 +15,7 @@ class User(Base):
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String(50), unique=True, index=True, nullable=False)
     email = Column(String(100), unique=True, index=True, nullable=False)
-    hashed_password = Column(String, nullable=False)
+    hashed_password = Column(String(255), nullable=False)
     full_name = Column(String(100), nullable=True)
     phone_number = Column(String, nullable=True)
     bio = Column(Text, nullable=True)
@@ -24,15 +23,15 @@ class User(Base):
     profile_picture_url = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True)
     is_admin = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.now())
-    updated_at = Column(DateTime, default=datetime.now(), onupdate=datetime.now())
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     notifications = relationship(
-        "Notification", back_populates="user", cascade="all, delete-orphan"
+        "Notification", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql"
     )
     posts = relationship(
-        "Post", back_populates="author", cascade="all, delete-orphan"
+        "Post", back_populates="author", cascade="all, delete-orphan", lazy="raise_on_sql"
     )
     comments = relationship(
-        "Comment", back_populates="user", cascade="all, delete-orphan"
+        "Comment", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql"
     )
\ No newline at end of file
@@ -1,7 +1,10 @@
 # app/routers/admin.py
 
 import os
+import re
+from itertools import islice
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models import Admin
@@ -18,19 +21,33 @@ from app.schemas import (
 )
 from app.utils import (
     create_access_token,
+    get_account_from_token,
     hash_password,
     verify_access_token,
     verify_password,
 )
 from app.utils import settings
-from app.utils.logger import logger
+from app.utils.logger import logger, log_file
 
 router = APIRouter()
 
+# Sensitive fragments masked out of log lines returned by `get_logs`
+SENSITIVE_LOG_PATTERN = re.compile(
+    r"password|secret|authorization|bearer\s+\S+|token", re.IGNORECASE
+)
+
+# Path of the audit log served by `get_logs`; overridable as a dependency
+def get_log_file() -> str:
+    return log_file
+
+
+# OAuth2 scheme to retrieve token from Authorization header
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+
 
 # Dependency to retrieve and verify the current admin user
-async def get_admin_user(
-    token: str = Depends(OAuth2PasswordBearer(tokenUrl="auth/login")),
+def get_admin_user(
+    token: str = Depends(oauth2_scheme),
     db: Session = Depends(get_db),
 ):
     try:
@@ -52,35 +69,38 @@ async def get_admin_user(
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        db_admin = db.query(Admin).filter(Admin.username == username).first()
+        db_admin = get_account_from_token(db, Admin, payload)
         if db_admin is None:
             logger.warning(
-                f"Unauthorized access attempt by unknown admin '{username}'."
+                "Unauthorized access attempt by unknown admin '%s'.",
+                username,
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to access this resource",
             )
 
-        logger.info(f"Admin '{username}' authenticated successfully.")
+        logger.info("Admin '%s' authenticated successfully.", username)
         return db_admin
     except Exception as e:
-        logger.error(f"Error during admin authentication: {e}")
+        logger.error("Error during admin authentication: %s", e)
         raise
 
 
 @router.post("/login", response_model=LoginResponse)
-async def login(user: UserLogin, db: Session = Depends(get_db)):
+def login(user: UserLogin, db: Session = Depends(get_db)):
     db_admin = db.query(Admin).filter(Admin.email == user.email).first()
 
     if not db_admin or not verify_password(user.password, db_admin.hashed_password):
-        logger.warning(f"Failed login attempt for email: {user.email}")
+        logger.warning("Failed login attempt for email: %s", user.email)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid credentials"
         )
 
-    access_token = create_access_token(data={"sub": db_admin.username})
-    logger.info(f"Admin '{db_admin.username}' logged in successfully.")
+    access_token = create_access_token(
+        data={"sub": db_admin.username, "user_id": db_admin.id}
+    )
+    logger.info("Admin '%s' logged in successfully.", db_admin.username)
     return {
         "access_token": access_token,
         "token_type": "bearer",
@@ -90,26 +110,34 @@ async def login(user: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.post("/register", response_model=RegisterResponse)
-async def register(user: AdminCreate, db: Session = Depends(get_db)):
+def register(user: AdminCreate, db: Session = Depends(get_db)):
     if user.master_key != settings.MASTER_KEY:
         logger.warning(
-            f"Invalid master key used during admin registration for username: '{user.username}' and email: {user.email}"
+            "Invalid master key used during admin registration for username: '%s' and email: %s",
+            user.username,
+            user.email,
         )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect master key"
         )
 
-    if db.query(Admin).filter(Admin.username == user.username).first():
+    existing_admin = (
+        db.query(Admin.username, Admin.email)
+        .filter(or_(Admin.username == user.username, Admin.email == user.email))
+        .first()
+    )
+    if existing_admin and existing_admin.username == user.username:
         logger.warning(
-            f"Attempt to register with an existing username: '{user.username}'"
+            "Attempt to register with an existing username: '%s'",
+            user.username,
         )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered",
         )
 
-    if db.query(Admin).filter(Admin.email == user.email).first():
-        logger.warning(f"Attempt to register with an existing email: {user.email}")
+    if existing_admin:
+        logger.warning("Attempt to register with an existing email: %s", user.email)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
         )
@@ -122,7 +150,9 @@ async def register(user: AdminCreate, db: Session = Depends(get_db)):
     db.commit()
     db.refresh(new_admin)
     logger.info(
-        f"New admin registered successfully: '{new_admin.username}' ({new_admin.email})."
+        "New admin registered successfully: '%s' (%s).",
+        new_admin.username,
+        new_admin.email,
     )
     return {
         "username": new_admin.username,
@@ -140,11 +170,20 @@ def get_all_users(
     ),
     offset: int = Query(0, ge=0, description="Number of users to skip."),
 ):
-    users = db.query(User).offset(offset).limit(limit).all()
+    # Select only the columns exposed by `AdminUsers` instead of full User rows
+    users = (
+        db.query(User.id, User.username, User.email, User.created_at)
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
     logger.info(
-        f"Admin '{admin.username}' retrieved all users ( offset {offset}, limit {limit} )."
+        "Admin '%s' retrieved all users ( offset %s, limit %s ).",
+        admin.username,
+        offset,
+        limit,
     )
-    return users
+    return [user._asdict() for user in users]
 
 
 @router.delete("/users/{user_id}", response_model=DetailResponse)
@@ -155,7 +194,9 @@ def delete_user(
 
     if not target_user:
         logger.warning(
-            f"Attempted deletion of non-existent user with ID: {user_id} by admin '{admin.username}'."
+            "Attempted deletion of non-existent user with ID: %s by admin '%s'.",
+            user_id,
+            admin.username,
         )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
@@ -164,33 +205,41 @@ def delete_user(
     db.delete(target_user)
     db.commit()
     logger.info(
-        f"Admin '{admin.username}' deleted user '{target_user.username}' (ID: {user_id})."
+        "Admin '%s' deleted user '%s' (ID: %s).",
+        admin.username,
+        target_user.username,
+        user_id,
     )
     return {"detail": f"Deleted user '{target_user.username}' successfully"}
 
 
 @router.get("/logs", response_model=LogResponse)
-def get_logs(admin: Admin = Depends(get_admin_user), skip: int = 0, limit: int = 100):
+def get_logs(
+    admin: Admin = Depends(get_admin_user),
+    skip: int = Query(0, ge=0, description="Number of log lines to skip."),
+    limit: int = Query(100, ge=1, description="Maximum number of log lines to return."),
+    log_file: str = Depends(get_log_file),
+):
     """
     Securely retrieves application logs.
     - Only accessible to authenticated admins.
     - Logs are paginated to prevent overwhelming responses.
     """
-    log_file = "audit_logs.log"
     if not os.path.exists(log_file):
-        logger.error(f"Log file not found when requested by admin '{admin.username}'.")
+        logger.error("Log file not found when requested by admin '%s'.", admin.username)
         raise HTTPException(status_code=404, detail="Log file not found")
 
+    # Paginate logs, reading only up to the end of the requested page
     with open(log_file, "r") as file:
-        logs = file.readlines()
+        logs = list(islice(file, skip, skip + limit))
 
     # Sanitize sensitive data
-    sanitized_logs = [line.replace("password", "****") for line in logs]
-
-    # Paginate logs
-    paginated_logs = sanitized_logs[skip : skip + limit]
+    paginated_logs = [SENSITIVE_LOG_PATTERN.sub("****", line) for line in logs]
 
     logger.info(
-        f"Admin '{admin.username}' retrieved application logs (skip: {skip}, limit: {limit})."
+        "Admin '%s' retrieved application logs (skip: %s, limit: %s).",
+        admin.username,
+        skip,
+        limit,
     )
     return {"logs": paginated_logs}
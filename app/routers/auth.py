@@ -4,6 +4,7 @@ from datetime import date
 from calendar import monthrange
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from app.schemas import (
     UserCreate,
@@ -23,7 +24,8 @@ from app.utils import (
     create_access_token,
     verify_access_token,
     create_refresh_token,
-    verify_refresh_token
+    verify_refresh_token,
+    get_account_from_token,
 )
 from app.database import get_db
 from app.utils.logger import logger
@@ -38,7 +40,7 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 # Dependency to retrieve and verify the current user
 # This will be used to secure routes that require user authentication
-async def get_current_user(
+def get_current_user(
     token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
 ):
     """
@@ -72,22 +74,21 @@ async def get_current_user(
             logger.error("Invalid token payload: Missing 'sub' field.")
             raise credentials_exception
 
-        # Query the user by username from the database
-        db_user = db.query(User).filter(User.username == username).first()
+        db_user = get_account_from_token(db, User, payload)
         if db_user is None:
-            logger.warning(f"Unauthorized access attempt by unknown user '{username}'.")
+            logger.warning("Unauthorized access attempt by unknown user '%s'.", username)
             raise credentials_exception
 
-        logger.info(f"User '{username}' authenticated successfully.")
+        logger.info("User '%s' authenticated successfully.", username)
         return db_user
     except Exception as e:
-        logger.error(f"Error during admin authentication: {e}")
+        logger.error("Error during admin authentication: %s", e)
         raise
 
 
 # Register route to create a new user account
 @router.post("/register", response_model=RegisterResponse)
-async def register(user: UserCreate, db: Session = Depends(get_db)):
+def register(user: UserCreate, db: Session = Depends(get_db)):
     """
     Registers a new user account.
 
@@ -101,19 +102,24 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
     Returns:
         User: The newly created user object.
     """
-    db_user = db.query(User).filter(User.username == user.username).first()
-    if db_user:
+    # Check username and email availability in a single query
+    existing_user = (
+        db.query(User.username, User.email)
+        .filter(or_(User.username == user.username, User.email == user.email))
+        .first()
+    )
+    if existing_user and existing_user.username == user.username:
         logger.warning(
-            f"Attempt to register with an existing username: {user.username}"
+            "Attempt to register with an existing username: %s",
+            user.username,
         )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already registered",
         )
 
-    db_email = db.query(User).filter(User.email == user.email).first()
-    if db_email:
-        logger.warning(f"Attempt to register with an existing email: {user.email}")
+    if existing_user:
+        logger.warning("Attempt to register with an existing email: %s", user.email)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
         )
@@ -130,7 +136,9 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
     db.refresh(new_user)
 
     logger.info(
-        f"New user registered successfully: {new_user.username} ({new_user.email})."
+        "New user registered successfully: %s (%s).",
+        new_user.username,
+        new_user.email,
     )
     return {
         "username": new_user.username,
@@ -142,7 +150,7 @@ async def register(user: UserCreate, db: Session = Depends(get_db)):
 
 # Login route for user authentication and token generation
 @router.post("/user/login", response_model=LoginResponse)
-async def user_login(user: UserLogin, db: Session = Depends(get_db)):
+def user_login(user: UserLogin, db: Session = Depends(get_db)):
     """
     Logs in a user by verifying the username and password, and returning a JWT access token.
 
@@ -164,16 +172,17 @@ async def user_login(user: UserLogin, db: Session = Depends(get_db)):
     )
 
     if not db_user or not verify_password(user.password, db_user.hashed_password):
-        logger.warning(f"Failed login attempt for email: {user.email}")
+        logger.warning("Failed login attempt for email: %s", user.email)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid credentials"
         )
 
     # Create access and refresh tokens
-    access_token = create_access_token(data={"sub": db_user.username})
-    refresh_token = create_refresh_token(data={"sub": db_user.username})
+    token_data = {"sub": db_user.username, "user_id": db_user.id}
+    access_token = create_access_token(data=token_data)
+    refresh_token = create_refresh_token(data=token_data)
 
-    logger.info(f"User '{db_user.username}' logged in successfully.")
+    logger.info("User '%s' logged in successfully.", db_user.username)
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
@@ -201,7 +210,7 @@ async def protected_route(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/user/refresh-token", response_model=RefreshResponse)
-async def get_refresh_token(token: RefreshToken, db: Session = Depends(get_db)):
+def get_refresh_token(token: RefreshToken, db: Session = Depends(get_db)):
     """
     Generate a new access token using a valid refresh token.
 
@@ -223,7 +232,7 @@ async def get_refresh_token(token: RefreshToken, db: Session = Depends(get_db)):
         )
 
     # Verify user existence
-    db_user = db.query(User).filter(User.username == username).first()
+    db_user = get_account_from_token(db, User, payload)
     if db_user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -231,7 +240,7 @@ async def get_refresh_token(token: RefreshToken, db: Session = Depends(get_db)):
         )
 
     # Generate new access token
-    access_token = create_access_token(data={"sub": username})
+    access_token = create_access_token(data={"sub": username, "user_id": db_user.id})
     return {"access_token": access_token, "token_type": "bearer"}
 
 
@@ -247,36 +256,22 @@ def delete_account(
         db (Session): Database session for querying and modifying the database.
         admin (Admin): The current admin user.
 
-    Raises:
-        HTTPException: If the user does not exist.
-
     Returns:
         dict: Success message confirming the user deletion.
     """
-    user_id = (
-        db.query(User.id)
-        .filter(User.username == user.username, User.email == user.email)
-        .first()[0]
-    )
-    target_user = db.query(User).filter(User.id == user_id).first()
+    username, user_id = user.username, user.id
 
-    if not target_user:
-        logger.warning(
-            f"Attempted deletion of account with ID: {user_id} by user '{user.username}'."
-        )
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
-        )
-
-    db.delete(target_user)
+    # `user` was loaded through the same request-scoped session, so it can be
+    # deleted directly without looking it up again
+    db.delete(user)
     db.commit()
-    logger.info(f"User '{user.username}' deleted account (ID: {user_id}).")
-    return {"detail": f"Deleted account of '{target_user.username}' successfully"}
+    logger.info("User '%s' deleted account (ID: %s).", username, user_id)
+    return {"detail": f"Deleted account of '{username}' successfully"}
 
 
 # Login route for user authentication and token generation
 @router.post("/login")
-async def login_for_oauth_form(
+def login_for_oauth_form(
     form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)
 ):
     db_user = db.query(User).filter(User.email == form_data.username).first()
@@ -287,7 +282,9 @@ async def login_for_oauth_form(
         )
 
     # Create and return the JWT access token
-    access_token = create_access_token(data={"sub": db_user.username})
+    access_token = create_access_token(
+        data={"sub": db_user.username, "user_id": db_user.id}
+    )
     return {
         "access_token": access_token,
         "token_type": "bearer",
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from datetime import date
+from datetime import datetime
 from app.schemas import UserCreate
 
 class AdminCreate(UserCreate):
@@ -15,7 +15,7 @@ class AdminUsers(BaseModel):
     id: int 
     username: str
     email : EmailStr
-    created_at : str
+    created_at : datetime
 
     class Config:
         from_attributes=True
@@ -7,4 +7,5 @@ from .security import (
     create_access_token, 
     create_refresh_token, 
     hash_password,
+    get_account_from_token,
 )
\ No newline at end of file
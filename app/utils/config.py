@@ -1,18 +1,32 @@
 # app/utils/config.py
 
-from pydantic_settings import BaseSettings
+import json
 import os
-from dotenv import load_dotenv
+import tempfile
+from pathlib import Path
+from typing import Annotated, Literal
+from pydantic import computed_field, field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
-load_dotenv()
+# `.env` in the project root, found regardless of the working directory
+ENV_FILE = Path(__file__).resolve().parents[2] / ".env"
 
 class Settings(BaseSettings):
+    """
+    Application settings. Each field is read from the environment variable of
+    the same name, or from `.env`, when `Settings()` is constructed, falling
+    back to the default declared here. Settings are read-only once constructed.
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE, env_file_encoding="utf-8", extra="ignore", frozen=True
+    )
+
     # Application settings
     APP_NAME: str = "Blog API"
     APP_DESCRIPTION: str = "An API for a blog web application"
     APP_VERSION: str = "1.0.0"
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")  # Default to 'development'
-    DEBUG: bool = ENVIRONMENT == "development"
+    ENVIRONMENT: Literal["development", "staging", "production"] = "development"
 
     # Database URL
     # Uncomment the following line to use the DATABASE_URL from the environment variables (e.g., for PostgreSQL)
@@ -21,15 +35,43 @@ class Settings(BaseSettings):
     # Comment the above line and uncomment the following line to use SQLite instead
     BLOG_DATABASE_URL: str = 'sqlite:///blog.db'
 
+    # Database connection pool
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 3600  # Seconds before a connection is replaced
+
     # Admin Master Key
-    MASTER_KEY: str = os.getenv("MASTER_KEY", "master_key")
+    MASTER_KEY: str = "master_key"
 
     # JWT and authentication settings
-    JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "myjwtsecretkey")  # Default secret
+    JWT_SECRET_KEY: str  # Required; there is no safe default for the signing key
+
+    # Background jobs
+    NOTIFICATION_CLEANUP_BATCH_SIZE: int = 10_000  # Rows deleted per transaction
+    SCHEDULER_LOCK_FILE: str = os.path.join(tempfile.gettempdir(), "blog-api-scheduler.lock")  # Ensures one worker runs the scheduler
 
     # Other security settings
-    ALLOWED_HOSTS: list = ["*"]
-    CORS_ORIGINS: list = ["http://localhost", "http://localhost:3000", "http://localhost:5173"]  # Add frontend URL if applicable
+    # Sets, so per-request membership checks are constant time. From the
+    # environment, give either a JSON list or a comma-separated string.
+    ALLOWED_HOSTS: Annotated[frozenset[str], NoDecode] = frozenset({"*"})
+    CORS_ORIGINS: Annotated[frozenset[str], NoDecode] = frozenset({"http://localhost", "http://localhost:3000", "http://localhost:5173"})  # Add frontend URL if applicable
+
+    @field_validator("ALLOWED_HOSTS", "CORS_ORIGINS", mode="before")
+    @classmethod
+    def split_host_list(cls, value):
+        if isinstance(value, str):
+            value = value.strip()
+            if value.startswith("["):
+                return json.loads(value)
+            return [item.strip() for item in value.split(",") if item.strip()]
+        return value
+
+    # Derived from ENVIRONMENT after loading, so a value set in `.env` counts too
+    @computed_field
+    @property
+    def DEBUG(self) -> bool:
+        return self.ENVIRONMENT == "development"
 
 
 # Instantiate settings
@@ -1,16 +1,270 @@
 # app/utils/logger.py
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# AuditFormatter only uses the time, level name and message, so skip collecting
+# thread, process and task details for every record created
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False  # Python 3.12+; ignored on older versions
+
+# Size of the write buffer in front of the log file
+LOG_BUFFER_SIZE = 128 * 1024
+# Maximum number of seconds a record may sit in the write buffer
+LOG_FLUSH_INTERVAL = 1.0
+# Bytes written after which the file is synced early, even within the interval
+LOG_SYNC_BYTES = 1024 * 1024
+# Maximum number of records the listener handles before ending a batch
+LOG_BATCH_SIZE = 256
+
+# fdatasync skips the metadata-only inode updates that fsync also writes out,
+# but isn't available on every platform
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+
+class AuditFormatter(logging.Formatter):
+    """
+    Formats records as `[<time>] - <LEVEL> - <message>`.
+
+    The formatted timestamp is cached and reused for all records created
+    within the same second, so `time.strftime` runs at most once a second.
+    """
+
+    def __init__(self, datefmt='%Y-%m-%d %H:%M:%S'):
+        super().__init__('[%(asctime)s] - %(levelname)s - %(message)s', datefmt=datefmt)
+        self._time_cache = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_second, formatted = self._time_cache
+        if second != cached_second:
+            formatted = time.strftime(datefmt or self.datefmt, self.converter(second))
+            self._time_cache = (second, formatted)
+        return formatted
+
+    def format(self, record):
+        if record.exc_info or record.exc_text or record.stack_info:
+            return super().format(record)
+        return f"[{self.formatTime(record)}] - {record.levelname} - {record.getMessage()}"
+
+
+class AuditFileHandler(RotatingFileHandler):
+    """
+    Rotating file handler that buffers writes instead of flushing every record.
+
+    Records at WARNING or above set `flush_pending`, and `AuditQueueListener`
+    flushes the handler at the end of the batch they arrived in. Otherwise the
+    buffer is flushed and the file synced to disk with `fdatasync` at most
+    once per `LOG_FLUSH_INTERVAL` seconds, or sooner after `LOG_SYNC_BYTES`,
+    rather than on every record. The file size is tracked in memory, so rollover
+    checks don't have to flush the buffer and ask the OS for the file position.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._size = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self.flush_pending = False
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def shouldRollover(self, record, msg=None):
+        if self.maxBytes <= 0:
+            return False
+        if msg is None:
+            msg = self.format(record) + self.terminator
+        if self._size + len(msg) < self.maxBytes:
+            return False
+        # See bpo-45401: Never rollover anything other than regular files
+        return not os.path.exists(self.baseFilename) or os.path.isfile(self.baseFilename)
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self.shouldRollover(record, msg):
+                self.sync()
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += len(msg)
+            self._unsynced += len(msg)
+            if (
+                self._unsynced >= LOG_SYNC_BYTES
+                or time.monotonic() - self._last_sync >= LOG_FLUSH_INTERVAL
+            ):
+                self.sync()
+            elif record.levelno >= logging.WARNING:
+                self.flush_pending = True
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        super().flush()
+        self.flush_pending = False
+
+    def sync(self):
+        """Flush the buffer and sync the file's data to disk if anything is pending."""
+        with self.lock:
+            if self.stream is not None and self._unsynced:
+                self.stream.flush()
+                _datasync(self.stream.fileno())
+            self.flush_pending = False
+            self._unsynced = 0
+            self._last_sync = time.monotonic()
+
+    def close(self):
+        self.sync()
+        super().close()
+
+
+class AuditQueueHandler(QueueHandler):
+    """
+    Queue handler with a cheaper `prepare` for the common case of a record
+    without exception or stack info. The message is merged with its args as
+    usual, but the record is copied through its `__dict__` rather than going
+    through the default formatter and `copy.copy`.
+    """
+
+    def prepare(self, record):
+        if record.exc_info or record.exc_text or record.stack_info:
+            return super().prepare(record)
+        msg = record.getMessage()
+        prepared = object.__new__(type(record))
+        prepared.__dict__.update(record.__dict__)
+        prepared.message = msg
+        prepared.msg = msg
+        prepared.args = None
+        return prepared
+
+
+class AuditQueueListener(QueueListener):
+    """
+    Queue listener that handles records in batches. A batch ends when the queue
+    runs dry or after `LOG_BATCH_SIZE` records, and only then are handlers
+    with a pending flush flushed, so a burst of warnings is written out once
+    rather than once per record. Handlers are also synced whenever the queue
+    has been idle for `LOG_FLUSH_INTERVAL` seconds, so buffered records never
+    wait long.
+    """
+
+    _batch_count = 0
+
+    def dequeue(self, block):
+        if self._batch_count < LOG_BATCH_SIZE:
+            try:
+                record = self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                self._batch_count += 1
+                return record
+        self._end_batch()
+        while True:
+            try:
+                record = self.queue.get(block, timeout=LOG_FLUSH_INTERVAL)
+                self._batch_count = 1
+                return record
+            except queue.Empty:
+                for handler in self.handlers:
+                    sync = getattr(handler, "sync", handler.flush)
+                    sync()
+
+    def stop(self):
+        # Records handled just before the sentinel may still be buffered
+        super().stop()
+        for handler in self.handlers:
+            sync = getattr(handler, "sync", handler.flush)
+            sync()
+
+    def _end_batch(self):
+        self._batch_count = 0
+        for handler in self.handlers:
+            if getattr(handler, "flush_pending", True):
+                handler.flush()
+
 
 # Configure logger
-log_formatter = logging.Formatter('[%(asctime)s] - %(levelname)s - %(message)s')
+log_formatter = AuditFormatter()
 log_file = "audit_logs.log"
 
-file_handler = RotatingFileHandler(log_file, maxBytes=5 * 1024 * 1024, backupCount=5)
+# Large files keep rollovers (and their renames) rare even under heavy traffic.
+# The file is opened on the first record, so a parent process that forks
+# workers before logging anything never holds a descriptor for it.
+file_handler = AuditFileHandler(
+    log_file, maxBytes=128 * 1024 * 1024, backupCount=20, delay=True
+)
 file_handler.setFormatter(log_formatter)
 file_handler.setLevel(logging.INFO)
 
+# Records are handed to a background thread that owns the file handler, so
+# logging calls only enqueue and never wait on disk writes or rotation
+log_queue = queue.SimpleQueue()
+queue_handler = AuditQueueHandler(log_queue)
+queue_listener = AuditQueueListener(log_queue, file_handler, respect_handler_level=True)
+queue_listener.start()
+
 logger = logging.getLogger("audit_logger")
 logger.setLevel(logging.INFO)
-logger.addHandler(file_handler)
+logger.addHandler(queue_handler)
+
+
+def _stop_listener():
+    queue_listener.stop()
+
+
+def _flush_before_fork():
+    # Hold the handler lock across the fork so the child never inherits a
+    # half-written buffer, and empty the buffer so it isn't written twice
+    file_handler.acquire()
+    if file_handler.stream is not None:
+        file_handler.stream.flush()
+
+
+def _reopen_after_fork():
+    """
+    Give a forked worker its own log file descriptor, queue and listener.
+
+    The listener thread doesn't survive the fork, and the inherited queue and
+    file object are copies of the parent's, so they are replaced rather than
+    shared. The file is reopened on the worker's first record.
+    """
+    global log_queue, queue_listener
+    stream, file_handler.stream = file_handler.stream, None
+    if stream is not None:
+        stream.close()
+    file_handler._unsynced = 0
+    file_handler.flush_pending = False
+    log_queue = queue.SimpleQueue()
+    queue_handler.queue = log_queue
+    queue_listener = AuditQueueListener(log_queue, file_handler, respect_handler_level=True)
+    queue_listener.start()
+
+
+atexit.register(_stop_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=_flush_before_fork,
+        after_in_parent=file_handler.release,
+        after_in_child=_reopen_after_fork,
+    )
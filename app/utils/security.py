@@ -1,11 +1,11 @@
 # app/utils/security.py
 
-import os
 import jwt
 from fastapi import Depends, HTTPException, status
 from datetime import datetime, timedelta
 from passlib.context import CryptContext
 from pydantic import ValidationError
+from .config import settings
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -41,9 +41,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 
 # JWT configuration
-SECRET_KEY = os.getenv(
-    "JWT_SECRET_KEY"
-)  # Ensure the JWT_SECRET_KEY is set in the environment
+SECRET_KEY = settings.JWT_SECRET_KEY  # Required; set JWT_SECRET_KEY in the environment or .env
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30  # Expiry time in minutes for access token
 
@@ -167,3 +165,31 @@ def verify_refresh_token(token: str) -> dict:
             detail="Invalid refresh token",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+# Load the account a decoded token refers to
+def get_account_from_token(db, model, payload: dict):
+    """
+    Load the account (a `User` or `Admin`) identified by a decoded token.
+
+    Tokens carrying a `user_id` claim are resolved by primary key, and the
+    account's username must still match the `sub` claim; this stops a token
+    for one account type from resolving to an account of the other type that
+    happens to share its id. Tokens issued without an id fall back to a
+    username lookup.
+
+    Args:
+        db (Session): The database session.
+        model: The account model to load, `User` or `Admin`.
+        payload (dict): The decoded token payload.
+
+    Returns:
+        The matching account, or None if there is none.
+    """
+    username = payload.get("sub")
+    account_id = payload.get("user_id")
+    if account_id is None:
+        return db.query(model).filter(model.username == username).first()
+    account = db.get(model, account_id)
+    if account is None or account.username != username:
+        return None
+    return account
@@ -0,0 +1,93 @@
+# tests/test_admin.py
+
+import pytest
+from app.models import Admin
+from app.main import app
+from app.routers.admin import SENSITIVE_LOG_PATTERN, get_log_file
+from app.utils import create_access_token, hash_password
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture(scope="module")
+def admin_headers():
+    db = TestingSessionLocal()
+    admin = Admin(
+        username="testadmin",
+        email="testadmin@example.com",
+        hashed_password=hash_password("adminpassword"),
+    )
+    db.add(admin)
+    db.commit()
+    access_token = create_access_token(data={"sub": admin.username})
+    db.close()
+    return {"Authorization": f"Bearer {access_token}"}
+
+
+# Test cases
+def test_get_all_users(client, test_user, admin_headers):
+    response = client.get("/admin/users", headers=admin_headers)
+    assert response.status_code == 200
+    users = response.json()
+    assert [user["username"] for user in users] == [test_user.username]
+    assert set(users[0]) == {"id", "username", "email", "created_at"}
+
+def test_get_all_users_with_admin_id_token(client, test_user, admin_headers):
+    # Tokens issued by /admin/login carry the admin's id, resolved by primary key
+    db = TestingSessionLocal()
+    admin = db.query(Admin).filter(Admin.username == "testadmin").one()
+    access_token = create_access_token(data={"sub": admin.username, "user_id": admin.id})
+    db.close()
+    response = client.get(
+        "/admin/users",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 200
+
+def test_get_all_users_requires_admin(client, test_user):
+    access_token = create_access_token(data={"sub": test_user.username})
+    response = client.get(
+        "/admin/users",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 403
+
+def test_get_all_users_rejects_user_token_with_matching_id(client, test_user):
+    # A user's id may coincide with an admin's id; the username must match too
+    access_token = create_access_token(
+        data={"sub": test_user.username, "user_id": test_user.id}
+    )
+    response = client.get(
+        "/admin/users",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 403
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "audit_logs.log"
+    app.dependency_overrides[get_log_file] = lambda: str(path)
+    yield path
+    del app.dependency_overrides[get_log_file]
+
+def test_get_logs(client, admin_headers, log_file):
+    log_file.write_text("".join(f"line {i} password=hunter{i}\n" for i in range(5)))
+    response = client.get("/admin/logs?skip=1&limit=2", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["logs"] == [
+        "line 1 ****=hunter1\n",
+        "line 2 ****=hunter2\n",
+    ]
+
+def test_get_logs_missing_file(client, admin_headers, log_file):
+    response = client.get("/admin/logs", headers=admin_headers)
+    assert response.status_code == 404
+
+def test_get_logs_rejects_negative_skip(client, admin_headers):
+    response = client.get("/admin/logs?skip=-1", headers=admin_headers)
+    assert response.status_code == 422
+
+def test_sensitive_log_pattern_masks_secrets():
+    line = "Failed login: Password=hunter2, header Authorization: Bearer abc.def"
+    assert SENSITIVE_LOG_PATTERN.sub("****", line) == (
+        "Failed login: ****=hunter2, header ****: ****"
+    )
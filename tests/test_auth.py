@@ -1,5 +1,7 @@
 # tests/test_auth.py
 
+from app.utils import create_access_token
+
 # Test cases
 def test_register_user(client):
     response = client.post(
@@ -18,6 +20,14 @@ def test_register_existing_user(client, test_user):
     assert response.status_code == 400
     assert response.json()["detail"] == "Username already registered"
 
+def test_register_existing_email(client, test_user):
+    response = client.post(
+        "/auth/register",
+        json={"username": "anotheruser", "email": test_user.email, "password": "password"},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+
 def test_login_user(client, test_user):
     response = client.post(
         "/auth/user/login",
@@ -52,6 +62,15 @@ def test_protected_route(client, test_user):
     assert response.status_code == 200
     assert response.json()["detail"].startswith("Hello, testuser!")
 
+def test_protected_route_with_username_only_token(client, test_user):
+    # Tokens issued before the user id was embedded are still accepted
+    access_token = create_access_token(data={"sub": test_user.username})
+    response = client.get(
+        "/auth/protected-route",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 200
+
 def test_refresh_token(client, test_user):
     # Login to get a refresh token
     login_response = client.post(
@@ -85,3 +104,29 @@ def test_access_protected_route_with_expired_token(client, test_user):
     )
     assert response.status_code == 401
     assert response.json()["detail"] == "Invalid token"
+
+
+def test_delete_account(client):
+    client.post(
+        "/auth/register",
+        json={"username": "deleteme", "email": "deleteme@example.com", "password": "password"},
+    )
+    login_response = client.post(
+        "/auth/user/login",
+        json={"email": "deleteme@example.com", "password": "password"},
+    )
+    access_token = login_response.json()["access_token"]
+
+    response = client.delete(
+        "/auth/account",
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
+    assert response.status_code == 200
+    assert response.json()["detail"] == "Deleted account of 'deleteme' successfully"
+
+    # The account can no longer log in
+    response = client.post(
+        "/auth/user/login",
+        json={"email": "deleteme@example.com", "password": "password"},
+    )
+    assert response.status_code == 400
@@ -0,0 +1,35 @@
+# tests/test_config.py
+
+import pytest
+from pathlib import Path
+from pydantic import ValidationError
+from app.utils.config import ENV_FILE, Settings
+
+
+def test_jwt_secret_key_is_required(monkeypatch):
+    monkeypatch.delenv("JWT_SECRET_KEY", raising=False)
+    with pytest.raises(ValidationError, match="JWT_SECRET_KEY"):
+        Settings(_env_file=None)
+
+def test_debug_follows_environment(monkeypatch):
+    monkeypatch.setenv("JWT_SECRET_KEY", "test-secret")
+    assert Settings(_env_file=None, ENVIRONMENT="development").DEBUG
+    assert not Settings(_env_file=None, ENVIRONMENT="production").DEBUG
+
+def test_env_file_is_found_from_any_directory(monkeypatch, tmp_path):
+    env_file = tmp_path / "project" / ".env"
+    env_file.parent.mkdir()
+    env_file.write_text("ENVIRONMENT=production\nMASTER_KEY=from-env-file\nJWT_SECRET_KEY=test-secret\n")
+    monkeypatch.setitem(Settings.model_config, "env_file", env_file)
+    for name in ("ENVIRONMENT", "MASTER_KEY", "JWT_SECRET_KEY"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    settings = Settings()
+    assert settings.ENVIRONMENT == "production"
+    assert not settings.DEBUG
+    assert settings.MASTER_KEY == "from-env-file"
+
+def test_default_env_file_is_anchored_to_project_root():
+    assert ENV_FILE.is_absolute()
+    assert ENV_FILE == Path(__file__).resolve().parents[1] / ".env"
@@ -0,0 +1,71 @@
+# tests/test_logger.py
+
+import logging
+import queue
+import time
+import pytest
+from app.utils.logger import AuditFileHandler, AuditFormatter, AuditQueueListener
+
+
+def make_record(message, level=logging.INFO):
+    return logging.LogRecord("audit_logger", level, __file__, 0, message, None, None)
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return tmp_path / "audit_logs.log"
+
+
+@pytest.fixture
+def handler(log_path):
+    handler = AuditFileHandler(str(log_path), maxBytes=0, delay=True)
+    handler.setFormatter(AuditFormatter())
+    yield handler
+    handler.close()
+
+
+def wait_for(predicate, timeout=0.5):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_rollover_creates_backups(log_path):
+    handler = AuditFileHandler(str(log_path), maxBytes=100, backupCount=2)
+    handler.setFormatter(AuditFormatter())
+    for i in range(6):
+        handler.handle(make_record(f"record {i} " + "x" * 20))
+    handler.close()
+
+    # Each line is 61 bytes, so every file holds a single record
+    files = [log_path.with_name(log_path.name + suffix) for suffix in ("", ".1", ".2")]
+    assert [path.read_text().count("\n") for path in files] == [1, 1, 1]
+    assert [path.read_text().split(" - ")[-1].split()[1] for path in files] == ["5", "4", "3"]
+    assert all(path.stat().st_size <= 100 for path in files)
+    assert not log_path.with_name(log_path.name + ".3").exists()
+
+
+def test_warning_is_flushed_without_waiting_for_interval(handler, log_path):
+    log_queue = queue.SimpleQueue()
+    listener = AuditQueueListener(log_queue, handler)
+    listener.start()
+    try:
+        log_queue.put(make_record("routine"))
+        log_queue.put(make_record("something odd", logging.WARNING))
+        assert wait_for(lambda: log_path.exists() and "something odd" in log_path.read_text())
+        assert "routine" in log_path.read_text()
+    finally:
+        listener.stop()
+
+
+def test_listener_stop_flushes_buffered_records(handler, log_path):
+    log_queue = queue.SimpleQueue()
+    listener = AuditQueueListener(log_queue, handler)
+    listener.start()
+    for i in range(3):
+        log_queue.put(make_record(f"record {i}"))
+    listener.stop()
+
+    lines = log_path.read_text().splitlines()
+    assert [line.split(" - ")[-1] for line in lines] == ["record 0", "record 1", "record 2"]
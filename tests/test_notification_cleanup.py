@@ -0,0 +1,33 @@
+# tests/test_notification_cleanup.py
+
+from datetime import datetime, timedelta, timezone
+from app.background_tasks.jobs import notification_cleanup
+from app.models import Notification
+from app.utils import settings
+from tests.conftest import TestingSessionLocal
+
+
+def test_delete_old_notifications(monkeypatch, test_user):
+    monkeypatch.setattr(notification_cleanup, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(
+        notification_cleanup,
+        "settings",
+        settings.model_copy(update={"NOTIFICATION_CLEANUP_BATCH_SIZE": 2}),
+    )
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    db = TestingSessionLocal()
+    db.add_all(
+        [
+            Notification(message=f"old {i}", user_id=test_user.id, created_at=now - timedelta(days=31))
+            for i in range(5)
+        ]
+        + [Notification(message="recent", user_id=test_user.id, created_at=now)]
+    )
+    db.commit()
+
+    notification_cleanup.delete_old_notifications()
+
+    remaining = [n.message for n in db.query(Notification).all()]
+    db.close()
+    assert remaining == ["recent"]